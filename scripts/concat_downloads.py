@@ -36,14 +36,15 @@ earliest = min(all_dates)
 latest = max(all_dates)
 print(f"\nDate range: {earliest} to {latest}")
 
-# Read and concatenate all files
+# Read and concatenate all files. Scan lazily and stream the result to the output
+# file, so the combined rows are never held in memory at once. Values are kept as
+# text, which skips per-file type inference and writes them back unchanged.
 print("\nReading and concatenating files...")
-frames = [pl.read_csv(f) for f in files]
-df = pl.concat(frames, how="vertical", rechunk=True)
+lf = pl.scan_csv(files, infer_schema=False)
 
 # Write output
 output_path = Path("downloads") / f"openairframes_adsb_{earliest}_{latest}.csv.gz"
 output_path.parent.mkdir(parents=True, exist_ok=True)
-df.write_csv(output_path, compression="gzip")
+lf.sink_csv(output_path, compression="gzip")
 
-print(f"\nWrote {output_path} with {df.height:,} rows")
\ No newline at end of file
+print(f"\nWrote {output_path}")
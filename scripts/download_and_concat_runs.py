@@ -50,25 +50,26 @@ def find_csv_files(download_dir):
 def concatenate_csv_files(csv_files, output_file):
     """Concatenate CSV files in order, preserving headers."""
     import gzip
+    import shutil
     
     print(f"\nConcatenating {len(csv_files)} CSV files...")
     
-    with gzip.open(output_file, 'wt') as outf:
+    # Stream each file into the output instead of holding all of its lines in memory
+    with gzip.open(output_file, 'wb') as outf:
         header_written = False
         
         for i, csv_file in enumerate(csv_files, 1):
             print(f"  [{i}/{len(csv_files)}] Processing {os.path.basename(csv_file)}")
             
-            with gzip.open(csv_file, 'rt') as inf:
-                lines = inf.readlines()
+            with gzip.open(csv_file, 'rb') as inf:
+                header = inf.readline()
                 
                 if not header_written:
                     # Write header from first file
-                    outf.writelines(lines)
+                    outf.write(header)
                     header_written = True
-                else:
-                    # Skip header for subsequent files
-                    outf.writelines(lines[1:])
+                # Skip header for subsequent files
+                shutil.copyfileobj(inf, outf, 1024 * 1024)
     
     print(f"\n✓ Concatenated CSV saved to: {output_file}")
     
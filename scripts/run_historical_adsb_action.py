@@ -9,7 +9,7 @@ Usage:
 import argparse
 import subprocess
 import sys
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from calendar import monthrange
 
 
@@ -18,8 +18,8 @@ def generate_monthly_chunks(start_date_str, end_date_str):
     
     End dates are exclusive (e.g., to process Jan 1-31, end_date should be Feb 1).
     """
-    start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-    end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+    start_date = date.fromisoformat(start_date_str)
+    end_date = date.fromisoformat(end_date_str)
     
     chunks = []
     current = start_date
@@ -34,8 +34,8 @@ def generate_monthly_chunks(start_date_str, end_date_str):
         chunk_end = min(next_month_start, end_date)
         
         chunks.append({
-            'start': current.strftime('%Y-%m-%d'),
-            'end': chunk_end.strftime('%Y-%m-%d')
+            'start': str(current),
+            'end': str(chunk_end)
         })
         
         # Move to first day of next month
@@ -1,107 +1,100 @@
 # Shared compression logic for ADS-B aircraft data
 import os
+from pathlib import Path
+import numpy as np
 import polars as pl
 
 COLUMNS = ['dbFlags', 'ownOp', 'year', 'desc', 'aircraft_category', 'r', 't']
 
 
-def compress_df_polars(df: pl.DataFrame, icao: str) -> pl.DataFrame:
-    """Compress a single ICAO group to its most informative row using Polars."""
-    # Create signature string
-    df = df.with_columns(
-        pl.concat_str([pl.col(c).cast(pl.Utf8) for c in COLUMNS], separator="|").alias("_signature")
-    )
-    
-    # Compute signature counts
-    signature_counts = df.group_by("_signature").len().rename({"len": "_sig_count"})
-    
-    # Group by signature and take first row
-    df = df.group_by("_signature").first()
-    
-    if df.height == 1:
-        # Only one unique signature, return it
-        result = df.drop("_signature").with_columns(pl.lit(icao).alias("icao"))
-        return result
-    
-    # For each row, create dict of non-empty column values and check subsets
-    # Convert to list of dicts for subset checking (same logic as pandas version)
-    rows_data = []
-    for row in df.iter_rows(named=True):
-        non_empty = {col: row[col] for col in COLUMNS if row[col] != '' and row[col] is not None}
-        rows_data.append({
-            'signature': row['_signature'],
-            'non_empty_dict': non_empty,
-            'non_empty_count': len(non_empty),
-            'row_data': row
-        })
-    
-    # Check if row i's non-empty values are a subset of row j's non-empty values
-    def is_subset_of_any(idx):
-        row_dict = rows_data[idx]['non_empty_dict']
-        row_count = rows_data[idx]['non_empty_count']
-        
-        for other_idx, other_data in enumerate(rows_data):
-            if idx == other_idx:
-                continue
-            other_dict = other_data['non_empty_dict']
-            other_count = other_data['non_empty_count']
-            
-            # Check if all non-empty values in current row match those in other row
-            if all(row_dict.get(k) == other_dict.get(k) for k in row_dict.keys()):
-                # If they match and other has more defined columns, current row is redundant
-                if other_count > row_count:
-                    return True
-        return False
-    
-    # Keep rows that are not subsets of any other row
-    keep_indices = [i for i in range(len(rows_data)) if not is_subset_of_any(i)]
-    
-    if len(keep_indices) == 0:
-        keep_indices = [0]  # Fallback: keep first row
-    
-    remaining_signatures = [rows_data[i]['signature'] for i in keep_indices]
-    df = df.filter(pl.col("_signature").is_in(remaining_signatures))
-    
-    if df.height > 1:
-        # Use signature counts to pick the most frequent one
-        df = df.join(signature_counts, on="_signature", how="left")
-        max_count = df["_sig_count"].max()
-        df = df.filter(pl.col("_sig_count") == max_count).head(1)
-        df = df.drop("_sig_count")
-    
-    result = df.drop("_signature").with_columns(pl.lit(icao).alias("icao"))
-    
-    # Ensure empty strings are preserved
-    for col in COLUMNS:
-        if col in result.columns:
-            result = result.with_columns(pl.col(col).fill_null(""))
-    
-    return result
+def non_empty_mask(df: pl.DataFrame) -> np.ndarray:
+    """uint8 array with bit k set for each row where COLUMNS[k] is non-empty."""
+    non_empty = df.select(
+        [(pl.col(c).cast(pl.Utf8) != '').fill_null(False) for c in COLUMNS]
+    ).to_numpy()
+    mask = np.zeros(df.height, dtype=np.uint8)
+    for k in range(len(COLUMNS)):
+        mask |= non_empty[:, k].astype(np.uint8) << k
+    return mask
+
+
+def dominated_rows(mask: np.ndarray, codes: np.ndarray, group_end: np.ndarray) -> np.ndarray:
+    """Flag rows whose non-empty values are all repeated by a more complete row.
+
+    Row i is dominated by row j when j's non-empty columns are a strict superset
+    of i's and both rows have the same value in each of i's non-empty columns.
+    Rows are only compared within their group, which must be contiguous.
+
+    Pairs are visited by offset: pass s compares every row with the row s positions
+    after it, for the rows whose group extends that far. Each pass is a vectorized
+    operation over at most n rows, so memory stays linear however large the groups.
+
+    Args:
+        mask: uint8 array with bit k set when COLUMNS[k] is non-empty in the row
+        codes: (n_rows, len(COLUMNS)) array of integer codes for the column values
+        group_end: For each row, the index one past the last row of its group
+
+    Returns:
+        Boolean array, True for dominated rows
+    """
+    n = len(mask)
+    set_bits = ((mask[:, None] >> np.arange(codes.shape[1], dtype=np.uint8)) & 1).astype(bool)
+    dominated = np.zeros(n, dtype=bool)
+    rows = np.arange(n)
+    offset = 1
+    while True:
+        rows = rows[rows + offset < group_end[rows]]
+        if len(rows) == 0:
+            return dominated
+        other = rows + offset
+        common = mask[rows] & mask[other]
+        same = codes[rows] == codes[other]
+        # other dominates row
+        dominated[rows] |= (
+            (common == mask[rows]) & (mask[other] != mask[rows])
+            & (same | ~set_bits[rows]).all(axis=1)
+        )
+        # row dominates other
+        dominated[other] |= (
+            (common == mask[other]) & (mask[rows] != mask[other])
+            & (same | ~set_bits[other]).all(axis=1)
+        )
+        offset += 1
 
 
-def compress_multi_icao_df(df: pl.DataFrame, verbose: bool = True) -> pl.DataFrame:
+def compress_multi_icao_df(df: pl.DataFrame | pl.LazyFrame, verbose: bool = True) -> pl.DataFrame:
     """Compress a DataFrame with multiple ICAOs to one row per ICAO.
     
     Args:
-        df: DataFrame with columns ['time', 'icao'] + COLUMNS
+        df: DataFrame or LazyFrame with columns ['time', 'icao'] + COLUMNS. A LazyFrame
+            is streamed through the exact-duplicate step without being loaded whole.
         verbose: Whether to print progress
     
     Returns:
         Compressed DataFrame with one row per ICAO
     """
-    if df.height == 0:
+    if isinstance(df, pl.DataFrame) and df.height == 0:
         return df
     
-    # Sort by icao and time
-    df = df.sort(['icao', 'time'])
-    
-    # Fill null values with empty strings for COLUMNS
-    for col in COLUMNS:
-        if col in df.columns:
-            df = df.with_columns(pl.col(col).cast(pl.Utf8).fill_null(""))
-    
-    # Quick deduplication of exact duplicates
-    df = df.unique(subset=['icao'] + COLUMNS, keep='first')
+    # Fill null values with empty strings for COLUMNS. These columns have few distinct
+    # values, so encode them as categoricals: hashing and comparing them during
+    # dedup then works on integer codes instead of strings.
+    #
+    # Quick deduplication of exact duplicates, remembering how often each signature was seen.
+    # The composite key is hashed column by column, so no joined signature string is built.
+    # Rows sharing a key differ only in time, so the earliest one is the key's minimum
+    # time; aggregating that avoids sorting every raw row, and only the deduplicated
+    # rows are sorted by icao and time afterwards. The aggregation runs on the streaming
+    # engine, so memory is bounded by the number of distinct keys, not raw rows.
+    keys = ['icao'] + COLUMNS
+    df = (
+        df.lazy()
+        .with_columns([pl.col(col).cast(pl.Utf8).fill_null("").cast(pl.Categorical) for col in COLUMNS])
+        .group_by(keys)
+        .agg(pl.col('time').min(), pl.len().alias('_sig_count'))
+        .collect(engine="streaming")
+        .sort(['icao', 'time'], maintain_order=True)
+    )
     if verbose:
         print(f"After quick dedup: {df.height} records")
     
@@ -109,18 +102,22 @@ def compress_multi_icao_df(df: pl.DataFrame, verbose: bool = True) -> pl.DataFra
     if verbose:
         print("Compressing per ICAO...")
     
-    icao_groups = df.partition_by('icao', as_dict=True, maintain_order=True)
-    compressed_dfs = []
-    
-    for icao_key, group_df in icao_groups.items():
-        icao = icao_key[0]
-        compressed = compress_df_polars(group_df, str(icao))
-        compressed_dfs.append(compressed)
-    
-    if compressed_dfs:
-        df_compressed = pl.concat(compressed_dfs)
-    else:
-        df_compressed = df.head(0)
+    # A row is redundant if another row of the same ICAO has a strict superset of its
+    # non-empty columns and agrees on every value the row has. Encode which COLUMNS
+    # are non-empty as one bit per column and compare the categorical codes, pairing
+    # rows within each ICAO group without materializing every pair.
+    codes = df.select([pl.col(c).to_physical() for c in COLUMNS]).to_numpy()
+    # Rows are sorted by icao, so each ICAO is a contiguous run ending at
+    # (row index - position within the ICAO + ICAO row count)
+    row = pl.int_range(pl.len())
+    group_end = df.select(row - row.over('icao') + pl.len().over('icao')).to_series().to_numpy()
+    df = df.filter(pl.Series(~dominated_rows(non_empty_mask(df), codes, group_end)))
+    
+    # Of the remaining rows, keep the most frequently seen signature (earliest on ties)
+    df = df.filter(pl.col('_sig_count') == pl.col('_sig_count').max().over('icao'))
+    df_compressed = df.unique(subset=['icao'], keep='first', maintain_order=True).drop(
+        '_sig_count'
+    ).with_columns([pl.col(col).cast(pl.Utf8) for col in COLUMNS])
     
     if verbose:
         print(f"After compress: {df_compressed.height} records")
@@ -133,18 +130,30 @@ def compress_multi_icao_df(df: pl.DataFrame, verbose: bool = True) -> pl.DataFra
     return df_compressed
 
 
-def load_parquet_part(part_id: int, date: str) -> pl.DataFrame:
-    """Load a single parquet part file for a date.
+def scan_parquet_part(parquet_file: Path, date: str) -> pl.LazyFrame:
+    """Lazily scan a raw parquet part file for a date.
     
     Args:
-        part_id: Part ID (e.g., 1, 2, 3)
+        parquet_file: Raw parquet file written by process_icao_chunk
         date: Date string in YYYY-MM-DD format
     
     Returns:
-        DataFrame with ADS-B data
+        LazyFrame with ADS-B data recorded on the given date (UTC)
     """
-    from pathlib import Path
-    
+    # Only the needed columns are decoded, the timezone is dropped inside the query,
+    # and rows outside the given date are filtered during the scan. Sometimes the
+    # adsb.lol export has rows at 00:00:00 of the next day or similar.
+    date_lit = pl.lit(date).str.strptime(pl.Date, "%Y-%m-%d")
+    return (
+        pl.scan_parquet(parquet_file)
+        .select(['time', 'icao', 'r', 't', 'dbFlags', 'ownOp', 'year', 'desc', 'aircraft_category'])
+        .with_columns(pl.col("time").dt.replace_time_zone(None))
+        .filter(pl.col("time").dt.date() == date_lit)
+    )
+
+
+def compress_parquet_part(part_id: int, date: str) -> pl.DataFrame:
+    """Compress a single parquet part file, streaming it rather than loading it whole."""
     parquet_file = Path(f"data/output/parquet_output/part_{part_id}_{date}.parquet")
     
     if not parquet_file.exists():
@@ -161,37 +170,25 @@ def load_parquet_part(part_id: int, date: str) -> pl.DataFrame:
             'aircraft_category': pl.Utf8
         })
     
-    print(f"Loading from parquet: {parquet_file}")
-    df = pl.read_parquet(
-        parquet_file,
-        columns=['time', 'icao', 'r', 't', 'dbFlags', 'ownOp', 'year', 'desc', 'aircraft_category']
-    )
-    
-    # Convert to timezone-naive datetime
-    if df["time"].dtype == pl.Datetime:
-        df = df.with_columns(pl.col("time").dt.replace_time_zone(None))
+    print(f"Compressing from parquet: {parquet_file} (part {part_id}, date {date})")
+    df = compress_multi_icao_df(scan_parquet_part(parquet_file, date), verbose=True)
     os.remove(parquet_file)
     return df
 
 
-def compress_parquet_part(part_id: int, date: str) -> pl.DataFrame:
-    """Load and compress a single parquet part file."""
-    df = load_parquet_part(part_id, date)
-    
-    if df.height == 0:
-        return df
-
-    # Filter to rows within the given date (UTC-naive). This is because sometimes adsb.lol export can have rows at 00:00:00 of next day or similar.
-    date_lit = pl.lit(date).str.strptime(pl.Date, "%Y-%m-%d")
-    df = df.filter(pl.col("time").dt.date() == date_lit)
-    
-    print(f"Loaded {df.height} raw records for part {part_id}, date {date}")
-    
-    return compress_multi_icao_df(df, verbose=True)
+def concat_compressed_dfs(df_base, df_new):
+    """Concatenate base and new compressed dataframes, keeping the most informative row per ICAO.
 
+    Most aircraft report the same metadata day after day. A new row whose values are
+    already present for the same ICAO in df_base adds nothing, so it is dropped and the
+    existing base row is carried forward unchanged. Only new signatures are appended.
 
-def concat_compressed_dfs(df_base, df_new):
-    """Concatenate base and new compressed dataframes, keeping the most informative row per ICAO."""
+    Accepts either two DataFrames or two LazyFrames and returns the same kind.
+    """
+    keys = ['icao'] + COLUMNS
+    seen = df_base.select(keys).unique()
+    df_new = df_new.join(seen, on=keys, how='anti', nulls_equal=True, maintain_order='left')
+    
     # Combine both dataframes
     df_combined = pl.concat([df_base, df_new])
-    return df_combined
\ No newline at end of file
+    return df_combined
@@ -16,22 +16,31 @@ def main():
 
     parquet_files = sorted(date_dir.glob("*.parquet"))
     df = None
-    if parquet_files: # TODO: This logic could be updated slightly.
-        print(f"No parquet files found in {date_dir}")
-
-        frames = [pl.read_parquet(p) for p in parquet_files]
-        df = pl.concat(frames, how="vertical", rechunk=True)
-
-        df = df.sort(["time", "icao"])
-        df = df.select(CORRECT_ORDER_OF_COLUMNS)
+    if parquet_files:
+        # Scan the parts lazily and sort them once. The result is one row per ICAO,
+        # so it is kept in memory and both outputs are written from it, instead of
+        # writing the parquet and reading it back for the CSV.
+        df_sorted = (
+            pl.scan_parquet(parquet_files)
+            .sort(["time", "icao"])
+            .select(CORRECT_ORDER_OF_COLUMNS)
+            .collect()
+        )
         
-        output_path = OUTPUT_DIR / f"openairframes_adsb_{args.date}.parquet"
-        print(f"Writing combined parquet to {output_path} with {df.height} rows")
-        df.write_parquet(output_path)
-
         csv_output_path = OUTPUT_DIR / f"openairframes_adsb_{args.date}.csv.gz"
-        print(f"Writing combined csv.gz to {csv_output_path} with {df.height} rows")
-        df.write_csv(csv_output_path, compression="gzip")
+        print(f"Writing combined csv.gz to {csv_output_path} with {df_sorted.height} rows")
+        df_sorted.write_csv(csv_output_path, compression="gzip")
+
+        # Written last and renamed into place, so an existing parquet means the whole
+        # day is done (main skips such days on reruns)
+        output_path = OUTPUT_DIR / f"openairframes_adsb_{args.date}.parquet"
+        print(f"Writing combined parquet to {output_path}")
+        tmp_path = output_path.with_name(output_path.name + ".part")
+        df_sorted.write_parquet(tmp_path, compression="zstd", compression_level=3, row_group_size=200_000)
+        tmp_path.replace(output_path)
+        df = df_sorted.lazy()
+    else:
+        print(f"No parquet files found in {date_dir}")
 
     if args.concat_with_latest_csv:
         print("Loading latest CSV from GitHub releases to concatenate with...")
@@ -57,10 +66,11 @@ def main():
             # Ensure column order matches before concatenating
             df_latest_csv = df_latest_csv.select(CORRECT_ORDER_OF_COLUMNS)
             from src.adsb.compress_adsb_to_aircraft_data import concat_compressed_dfs
-            df_final = concat_compressed_dfs(df_latest_csv, df)
-            df_final = df_final.select(CORRECT_ORDER_OF_COLUMNS)
+            # The day is already in memory; join it lazily and stream the result to the CSV
+            lf_final = concat_compressed_dfs(df_latest_csv.lazy(), df)
+            lf_final = lf_final.select(CORRECT_ORDER_OF_COLUMNS)
             final_csv_output_path = OUTPUT_DIR / f"openairframes_adsb_{csv_start_date}_{args.date}.csv.gz"
-            df_final.write_csv(final_csv_output_path, compression="gzip")
+            lf_final.sink_csv(final_csv_output_path, compression="gzip")
         print(f"Final CSV written to {final_csv_output_path}")
 
 if __name__ == "__main__":
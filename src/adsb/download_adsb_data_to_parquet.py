@@ -80,7 +80,9 @@ def _fetch_releases_from_repo(year: str, version_date: str) -> list:
         
         for attempt in range(1, max_retries + 1):
             try:
-                req = urllib.request.Request(f"{BASE_URL}?page={page}", headers=HEADERS)
+                # 100 is the largest page size the API allows, so the full release
+                # list takes a third of the requests the default 30 would
+                req = urllib.request.Request(f"{BASE_URL}?per_page=100&page={page}", headers=HEADERS)
                 with urllib.request.urlopen(req) as response:
                     if response.status == 200:
                         data = orjson.loads(response.read())
@@ -168,7 +170,7 @@ def download_asset(asset_url: str, file_path: str, expected_size: int | None = N
                 if response.status == 200:
                     with open(file_path, "wb") as file:
                         while True:
-                            chunk = response.read(8192)
+                            chunk = response.read(1024 * 1024)  # 1 MiB
                             if not chunk:
                                 break
                             file.write(chunk)
@@ -315,6 +317,49 @@ def extract_split_archive(file_paths: list, extract_dir: str) -> bool:
 ALLOWED_DATA_SOURCE = {'', 'adsb.lol', 'adsbexchange', 'airplanes.live'}
 
 
+# Trace 'aircraft' fields stored per row, with the value used when a field is missing.
+# Empty-list defaults are only read, never mutated, so sharing one instance is safe.
+AIRCRAFT_FIELDS = (
+    ('alert', None),
+    ('alt_geom', None),
+    ('gva', None),
+    ('nac_p', None),
+    ('nac_v', None),
+    ('nic', None),
+    ('nic_baro', None),
+    ('rc', None),
+    ('sda', None),
+    ('sil', None),
+    ('sil_type', ""),
+    ('spi', None),
+    ('track', None),
+    ('type', ""),
+    ('version', None),
+    ('category', ''),
+    ('emergency', ''),
+    ('flight', ""),
+    ('squawk', ""),
+    ('baro_rate', None),
+    ('nav_altitude_fms', None),
+    ('nav_altitude_mcp', None),
+    ('nav_modes', []),
+    ('nav_qnh', None),
+    ('geom_rate', None),
+    ('ias', None),
+    ('mach', None),
+    ('mag_heading', None),
+    ('oat', None),
+    ('roll', None),
+    ('tas', None),
+    ('tat', None),
+    ('true_heading', None),
+    ('wd', None),
+    ('ws', None),
+    ('track_rate', None),
+    ('nav_heading', None),
+)
+
+
 def process_file(filepath: str) -> list:
     """
     Process a single trace file and return list of rows.
@@ -342,6 +387,8 @@ def process_file(filepath: str) -> list:
             print(f"Skipping file {filepath} as it does not contain 'timestamp' or 'trace'")
             return []
         
+        data_source_value = "adsb.lol" if "adsb.lol" in ALLOWED_DATA_SOURCE else ""
+        
         for row in trace_data:
             time_offset = row[0]
             lat = row[1]
@@ -364,7 +411,6 @@ def process_file(filepath: str) -> list:
             vertical_rate = row[7]
             aircraft = row[8]
             source = row[9]
-            data_source_value = "adsb.lol" if "adsb.lol" in ALLOWED_DATA_SOURCE else ""
             geometric_altitude = row[10]
             geometric_vertical_rate = row[11]
             indicated_airspeed = row[12]
@@ -373,64 +419,19 @@ def process_file(filepath: str) -> list:
             time_val = timestamp + time_offset
             dt64 = dt.datetime.fromtimestamp(time_val, tz=dt.timezone.utc)
             
-            # Prepare base fields
+            if aircraft is None or type(aircraft) is not dict:
+                aircraft = dict()
+            
+            # Build the whole row in one list instead of extending it piece by piece
             inserted_row = [
                 dt64, icao, r, t, dbFlags, noRegData, ownOp, year, desc,
                 lat, lon, alt_baro, on_ground, ground_speed, track_degrees,
-                flags, vertical_rate
-            ]
-            next_part = [
+                flags, vertical_rate,
                 source, geometric_altitude, geometric_vertical_rate,
-                indicated_airspeed, roll_angle
+                indicated_airspeed, roll_angle,
+                *[aircraft.get(key, default) for key, default in AIRCRAFT_FIELDS],
+                data_source_value,
             ]
-            inserted_row.extend(next_part)
-            
-            if aircraft is None or type(aircraft) is not dict:
-                aircraft = dict()
-            
-            aircraft_data = {
-                'alert': aircraft.get('alert', None),
-                'alt_geom': aircraft.get('alt_geom', None),
-                'gva': aircraft.get('gva', None),
-                'nac_p': aircraft.get('nac_p', None),
-                'nac_v': aircraft.get('nac_v', None),
-                'nic': aircraft.get('nic', None),
-                'nic_baro': aircraft.get('nic_baro', None),
-                'rc': aircraft.get('rc', None),
-                'sda': aircraft.get('sda', None),
-                'sil': aircraft.get('sil', None),
-                'sil_type': aircraft.get('sil_type', ""),
-                'spi': aircraft.get('spi', None),
-                'track': aircraft.get('track', None),
-                'type': aircraft.get('type', ""),
-                'version': aircraft.get('version', None),
-                'category': aircraft.get('category', ''),
-                'emergency': aircraft.get('emergency', ''),
-                'flight': aircraft.get('flight', ""),
-                'squawk': aircraft.get('squawk', ""),
-                'baro_rate': aircraft.get('baro_rate', None),
-                'nav_altitude_fms': aircraft.get('nav_altitude_fms', None),
-                'nav_altitude_mcp': aircraft.get('nav_altitude_mcp', None),
-                'nav_modes': aircraft.get('nav_modes', []),
-                'nav_qnh': aircraft.get('nav_qnh', None),
-                'geom_rate': aircraft.get('geom_rate', None),
-                'ias': aircraft.get('ias', None),
-                'mach': aircraft.get('mach', None),
-                'mag_heading': aircraft.get('mag_heading', None),
-                'oat': aircraft.get('oat', None),
-                'roll': aircraft.get('roll', None),
-                'tas': aircraft.get('tas', None),
-                'tat': aircraft.get('tat', None),
-                'true_heading': aircraft.get('true_heading', None),
-                'wd': aircraft.get('wd', None),
-                'ws': aircraft.get('ws', None),
-                'track_rate': aircraft.get('track_rate', None),
-                'nav_heading': aircraft.get('nav_heading', None)
-            }
-            
-            aircraft_list = list(aircraft_data.values())
-            inserted_row.extend(aircraft_list)
-            inserted_row.append(data_source_value)
             
             insert_rows.append(inserted_row)
     
@@ -534,25 +535,29 @@ PARQUET_SCHEMA = pa.schema([
 ])
 
 
-def collect_trace_files_with_find(root_dir):
+def iter_trace_files(root_dir):
+    """Yield (icao, path) for every trace_full_*.json file below root_dir.
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no extra stat call is needed per file.
+    """
+    stack = [root_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (
+                    entry.name.startswith("trace_full_")
+                    and entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    yield entry.name[len("trace_full_"):-len(".json")], entry.path
+
+
+def collect_trace_files(root_dir):
     """Find all trace_full_*.json files in the extracted directory."""
-    trace_dict: dict[str, str] = {}
-    cmd = ['find', root_dir, '-type', 'f', '-name', 'trace_full_*.json']
-    
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    
-    if result.returncode != 0:
-        print(f"Error executing find: {result.stderr}")
-        return trace_dict
-    
-    for file_path in result.stdout.strip().split('\n'):
-        if file_path:
-            filename = os.path.basename(file_path)
-            if filename.startswith("trace_full_") and filename.endswith(".json"):
-                icao = filename[len("trace_full_"):-len(".json")]
-                trace_dict[icao] = file_path
-                    
-    return trace_dict
+    return dict(iter_trace_files(root_dir))
 
 
 def create_parquet_for_day(day, keep_folders: bool = False):
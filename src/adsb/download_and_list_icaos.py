@@ -11,6 +11,7 @@ import sys
 import argparse
 import glob
 import subprocess
+import concurrent.futures
 from datetime import datetime, timedelta
 
 # Re-use download/extract functions from download_adsb_data_to_parquet
@@ -19,9 +20,12 @@ from src.adsb.download_adsb_data_to_parquet import (
     fetch_releases,
     download_asset,
     extract_split_archive,
-    collect_trace_files_with_find,
+    collect_trace_files,
 )
 
+# Number of release assets downloaded at the same time
+DOWNLOAD_WORKERS = 4
+
 
 def download_and_extract(version_date: str) -> str | None:
     """Download and extract tar files, return extract directory path."""
@@ -58,7 +62,7 @@ def download_and_extract(version_date: str) -> str | None:
         releases = normal_releases if normal_releases else tmp_releases
         print(f"Using {'normal' if normal_releases else 'tmp'} releases ({len(releases)} found)")
         
-        downloaded_files = []
+        to_download = []
         for release in releases:
             tag_name = release["tag_name"]
             print(f"Processing release: {tag_name}")
@@ -79,8 +83,20 @@ def download_and_extract(version_date: str) -> str | None:
                 asset_url = asset["browser_download_url"]
                 asset_size = asset.get("size")  # Get expected file size
                 file_path = os.path.join(OUTPUT_DIR, asset_name)
-                if download_asset(asset_url, file_path, expected_size=asset_size):
-                    downloaded_files.append(file_path)
+                to_download.append((asset_url, file_path, asset_size))
+        
+        # Split archive parts are independent files, so fetch them concurrently;
+        # each download is bound by network latency rather than CPU.
+        downloaded_files = []
+        if to_download:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(to_download), DOWNLOAD_WORKERS)) as executor:
+                results = executor.map(
+                    lambda item: download_asset(item[0], item[1], expected_size=item[2]),
+                    to_download,
+                )
+                for (_, file_path, _), ok in zip(to_download, results):
+                    if ok:
+                        downloaded_files.append(file_path)
     
     if not downloaded_files:
         print(f"No files downloaded for {version_date}")
@@ -94,7 +110,7 @@ def download_and_extract(version_date: str) -> str | None:
 
 def list_icao_folders(extract_dir: str) -> list[str]:
     """List all ICAO folder names from extracted directory."""
-    trace_files = collect_trace_files_with_find(extract_dir)
+    trace_files = collect_trace_files(extract_dir)
     icaos = sorted(trace_files.keys())
     print(f"Found {len(icaos)} unique ICAOs")
     return icaos
@@ -4,7 +4,7 @@
 import json
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 
 def generate_chunks(start_date: str, end_date: str, chunk_days: int) -> list[dict]:
@@ -18,23 +18,19 @@ def generate_chunks(start_date: str, end_date: str, chunk_days: int) -> list[dic
     Returns:
         List of chunk dictionaries with start_date and end_date (both inclusive within chunk)
     """
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
     
-    chunks = []
-    current = start
-    
-    # end_date is exclusive, so we process up to but not including it
-    while current < end:
-        # chunk_end is inclusive, so subtract 1 from the next chunk start
-        chunk_end = min(current + timedelta(days=chunk_days - 1), end - timedelta(days=1))
-        chunks.append({
-            "start_date": current.strftime("%Y-%m-%d"),
-            "end_date": chunk_end.strftime("%Y-%m-%d"),
-        })
-        current = chunk_end + timedelta(days=1)
-    
-    return chunks
+    # end_date is exclusive, so we process up to but not including it.
+    # Each chunk's end_date is inclusive: the day before the next chunk starts.
+    ndays = (end - start).days
+    return [
+        {
+            "start_date": str(start + timedelta(days=offset)),
+            "end_date": str(start + timedelta(days=min(offset + chunk_days, ndays) - 1)),
+        }
+        for offset in range(0, ndays, chunk_days)
+    ]
 
 
 def main() -> None:
@@ -6,23 +6,67 @@ Usage:
     python -m src.adsb.main --start_date 2026-01-01 --end_date 2026-01-03
 """
 import argparse
+import concurrent.futures
 import subprocess
 import sys
 from datetime import datetime, timedelta
 
 import polars as pl
 
+from src.adsb.concat_parquet_to_final import CORRECT_ORDER_OF_COLUMNS, OUTPUT_DIR
 from src.adsb.download_and_list_icaos import NUMBER_PARTS
 
 
+def process_day(date_str: str, concat_with_latest_csv: bool = False, force: bool = False) -> None:
+    """Run the download, per-part processing and concatenation steps for one day.
+
+    Steps whose output already exists are skipped, so rerunning a range after a
+    failure only redoes the parts and days that did not finish. Outputs are reused
+    based only on their presence, so pass force=True (--force) to recompute them
+    after a code or data fix.
+    """
+    print(f"Processing day: {date_str}")
+
+    compressed_dir = OUTPUT_DIR / "compressed" / date_str
+    pending_parts = [
+        part_id for part_id in range(NUMBER_PARTS)
+        if force or not (compressed_dir / f"part_{part_id}_{date_str}.parquet").exists()
+    ]
+    day_parquet = OUTPUT_DIR / f"openairframes_adsb_{date_str}.parquet"
+    if not pending_parts and day_parquet.exists() and not concat_with_latest_csv:
+        print(f"Skipping {date_str}: reusing existing {day_parquet} (use --force to recompute)")
+        return
+
+    if pending_parts:
+        # Download and split
+        subprocess.run([sys.executable, "-m", "src.adsb.download_and_list_icaos", "--date", date_str], check=True)
+
+        # Process parts
+        for part_id in pending_parts:
+            subprocess.run([sys.executable, "-m", "src.adsb.process_icao_chunk", "--part-id", str(part_id), "--date", date_str], check=True)
+    else:
+        print(f"Reusing existing compressed parts in {compressed_dir}, skipping download (use --force to recompute)")
+
+    # Concatenate
+    concat_cmd = [sys.executable, "-m", "src.adsb.concat_parquet_to_final", "--date", date_str]
+    if concat_with_latest_csv:
+        concat_cmd.append("--concat_with_latest_csv")
+    subprocess.run(concat_cmd, check=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Process ADS-B data for a single day or date range")
     parser.add_argument("--date", type=str, help="Single date in YYYY-MM-DD format")
     parser.add_argument("--start_date", type=str, help="Start date (inclusive, YYYY-MM-DD)")
     parser.add_argument("--end_date", type=str, help="End date (exclusive, YYYY-MM-DD)")
     parser.add_argument("--concat_with_latest_csv", action="store_true", help="Also concatenate with latest CSV from GitHub releases")
+    parser.add_argument("--force", action="store_true", help="Recompute days and parts even if their outputs already exist")
+    parser.add_argument("--parallel_days", type=int, default=1, help="Number of days to process at the same time (default: 1)")
     args = parser.parse_args()
 
+    if args.parallel_days < 1:
+        raise SystemExit("--parallel_days must be at least 1.")
+
     if args.date and (args.start_date or args.end_date):
         raise SystemExit("Use --date or --start_date/--end_date, not both.")
 
@@ -35,40 +79,64 @@ def main():
         start_date = datetime.strptime(args.start_date, "%Y-%m-%d")
         end_date = datetime.strptime(args.end_date, "%Y-%m-%d")
 
+    dates = []
     current = start_date
     while current < end_date:
-        date_str = current.strftime("%Y-%m-%d")
-        print(f"Processing day: {date_str}")
-
-        # Download and split
-        subprocess.run([sys.executable, "-m", "src.adsb.download_and_list_icaos", "--date", date_str], check=True)
-
-        # Process parts
-        for part_id in range(NUMBER_PARTS):
-            subprocess.run([sys.executable, "-m", "src.adsb.process_icao_chunk", "--part-id", str(part_id), "--date", date_str], check=True)
-
-        # Concatenate
-        concat_cmd = [sys.executable, "-m", "src.adsb.concat_parquet_to_final", "--date", date_str]
-        if args.concat_with_latest_csv:
-            concat_cmd.append("--concat_with_latest_csv")
-        subprocess.run(concat_cmd, check=True)
-
+        dates.append(current.strftime("%Y-%m-%d"))
         current += timedelta(days=1)
-
-    if end_date - start_date > timedelta(days=1):
-        dates = []
-        cur = start_date
-        while cur < end_date:
-            dates.append(cur.strftime("%Y-%m-%d"))
-            cur += timedelta(days=1)
-        csv_files = [
-            f"data/outputs/openairframes_adsb_{d}_{d}.csv"
-            for d in dates
-        ]
-        frames = [pl.read_csv(p) for p in csv_files]
-        df = pl.concat(frames, how="vertical", rechunk=True)
-        output_path = f"data/outputs/openairframes_adsb_{start_date.strftime('%Y-%m-%d')}_{end_date.strftime('%Y-%m-%d')}.csv"
-        df.write_csv(output_path)
+    multi_day = len(dates) > 1
+    if not dates:
+        print("Done")
+        return
+
+    # Days are independent until the final combine, so --parallel_days can run several
+    # at once. Each day already uses every core and extracts a large archive, so this
+    # is opt-in. Each day is a chain of subprocesses, so threads are enough to drive them.
+    concat_each_day = args.concat_with_latest_csv and not multi_day
+    if args.parallel_days == 1:
+        for date_str in dates:
+            process_day(date_str, concat_each_day, args.force)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(dates), args.parallel_days)) as executor:
+            futures = [executor.submit(process_day, date_str, concat_each_day, args.force) for date_str in dates]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Stop at the first failed day: queued days are cancelled, and only
+                # the ones already running are waited for
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    if multi_day:
+        def scan_days(days: list[str]) -> pl.LazyFrame:
+            files = [OUTPUT_DIR / f"openairframes_adsb_{d}.parquet" for d in days]
+            return pl.scan_parquet(files).select(CORRECT_ORDER_OF_COLUMNS)
+
+        # Build the combined output lazily and stream it to disk
+        if args.concat_with_latest_csv:
+            from src.get_latest_release import get_latest_aircraft_adsb_csv_df
+            from src.adsb.compress_adsb_to_aircraft_data import COLUMNS, concat_compressed_dfs
+
+            df_latest_csv, csv_start_date, csv_end_date = get_latest_aircraft_adsb_csv_df()
+            # Days up to csv_end_date are already included in the latest release
+            new_dates = [d for d in dates if d > csv_end_date]
+            lf = df_latest_csv.lazy().select(CORRECT_ORDER_OF_COLUMNS)
+            last_date = csv_end_date
+            if new_dates:
+                # Most aircraft repeat the same row every day. Keep each row only from
+                # the first day it appears, as appending the days one at a time would,
+                # so the join against the release only sees each new row once.
+                lf_new = scan_days(new_dates).unique(
+                    subset=["icao"] + COLUMNS, keep="first", maintain_order=True
+                )
+                lf = concat_compressed_dfs(lf, lf_new).select(CORRECT_ORDER_OF_COLUMNS)
+                last_date = new_dates[-1]
+            output_path = OUTPUT_DIR / f"openairframes_adsb_{csv_start_date}_{last_date}.csv.gz"
+            lf.sink_csv(output_path, compression="gzip")
+        else:
+            output_path = OUTPUT_DIR / f"openairframes_adsb_{dates[0]}_{end_date.strftime('%Y-%m-%d')}.csv"
+            scan_days(dates).sink_csv(output_path)
         print(f"Wrote combined CSV: {output_path}")
 
     print("Done")
@@ -10,6 +10,7 @@ import os
 import sys
 import argparse
 import time
+import subprocess
 import concurrent.futures
 from datetime import datetime, timedelta
 import tarfile
@@ -23,16 +24,52 @@ from src.adsb.download_adsb_data_to_parquet import (
     OUTPUT_DIR,
     PARQUET_DIR,
     PARQUET_SCHEMA,
-    COLUMNS,
     MAX_WORKERS,
     process_file,
     get_resource_usage,
-    collect_trace_files_with_find,
+    collect_trace_files,
 )
 
 
 # Smaller batch size for memory efficiency
 BATCH_SIZE = 100_000
+# Low-cardinality string columns of PARQUET_SCHEMA worth dictionary-encoding
+DICTIONARY_COLUMNS = ['icao', 'r', 't', 'desc', 'ownOp', 'aircraft_category', 'source', 'data_source']
+
+
+def extract_with_pigz(archive_path: str, extract_dir: str) -> bool:
+    """Extract a tar.gz archive with 'pigz -dc | tar -x'.
+
+    pigz decompresses in native code with reading, writing and checksumming on
+    separate threads, which is much faster than Python's single-threaded gzip.
+
+    Returns:
+        True if both pigz and tar succeeded, False otherwise
+    """
+    pigz_proc = subprocess.Popen(
+        ["pigz", "-dc", archive_path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    result = subprocess.run(
+        ["tar", "-xf", "-", "-C", extract_dir, "--no-same-owner", "--no-same-permissions"],
+        stdin=pigz_proc.stdout,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    pigz_proc.stdout.close()
+    pigz_stderr = pigz_proc.stderr.read().decode() if pigz_proc.stderr else ""
+    pigz_proc.wait()
+    
+    if pigz_proc.returncode != 0 or result.returncode != 0:
+        print(f"pigz/tar extraction failed (pigz exit {pigz_proc.returncode}, tar exit {result.returncode})")
+        if pigz_stderr:
+            print(f"pigz stderr: {pigz_stderr}")
+        if result.stderr:
+            print(f"tar stderr: {result.stderr.decode()}")
+        return False
+    return True
+
 
 def build_trace_file_map(archive_path: str) -> dict[str, str]:
     """Build a map of ICAO -> trace file path by extracting tar.gz archive."""
@@ -40,31 +77,55 @@ def build_trace_file_map(archive_path: str) -> dict[str, str]:
     
     temp_dir = tempfile.mkdtemp(prefix="adsb_extract_")
     
-    with tarfile.open(archive_path, 'r:gz') as tar:
-        tar.extractall(path=temp_dir, filter='data')
+    if shutil.which("pigz") and extract_with_pigz(archive_path, temp_dir):
+        # tar's own filter='data' checks are not applied on this path, so make sure
+        # nothing we are about to read resolves outside the extraction directory.
+        root = os.path.realpath(temp_dir) + os.sep
+        trace_map = {
+            icao: path
+            for icao, path in collect_trace_files(temp_dir).items()
+            if os.path.realpath(path).startswith(root)
+        }
+    else:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+        with tarfile.open(archive_path, 'r:gz') as tar:
+            tar.extractall(path=temp_dir, filter='data')
+        trace_map = collect_trace_files(temp_dir)
     
-    trace_map = collect_trace_files_with_find(temp_dir)
     print(f"Found {len(trace_map)} trace files")
     
     return trace_map
 
 
-def safe_process(filepath: str) -> list:
-    """Safely process a file, returning empty list on error."""
+def safe_process(filepath: str) -> bytes | None:
+    """Process a file into a serialized Arrow record batch, or None on error or no rows.
+
+    Returning Arrow IPC bytes instead of a list of row tuples keeps the transfer
+    back to the parent a single buffer rather than a pickle of every value.
+    """
     try:
-        return process_file(filepath)
+        rows = process_file(filepath)
+        if not rows:
+            return None
+        return rows_to_batch(rows).serialize().to_pybytes()
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
-        return []
+        return None
 
 
-def rows_to_table(rows: list) -> pa.Table:
-    """Convert list of rows to PyArrow table."""
-    import pandas as pd
-    df = pd.DataFrame(rows, columns=COLUMNS)
-    if not df['time'].dt.tz:
-        df['time'] = df['time'].dt.tz_localize('UTC')
-    return pa.Table.from_pandas(df, schema=PARQUET_SCHEMA, preserve_index=False)
+def rows_to_batch(rows: list) -> pa.RecordBatch:
+    """Convert list of rows to a PyArrow record batch.
+
+    Each column is built directly as a typed Arrow array, without a pandas
+    DataFrame in between. Row times are UTC-aware datetimes, matching the
+    schema's timestamp type.
+    """
+    arrays = [
+        pa.array(column, type=field.type)
+        for column, field in zip(zip(*rows), PARQUET_SCHEMA)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=PARQUET_SCHEMA)
 
 
 def process_chunk(
@@ -78,31 +139,49 @@ def process_chunk(
     
     start_time = time.perf_counter()
     total_rows = 0
-    batch_rows = []
+    pending_batches = []
+    pending_rows = 0
     writer = None
     
     try:
-        writer = pq.ParquetWriter(output_path, PARQUET_SCHEMA, compression='snappy')
+        # Dictionary-encode only the low-cardinality string columns and keep statistics
+        # only for time, which scan_parquet_part filters on when reading the part back.
+        writer = pq.ParquetWriter(
+            output_path,
+            PARQUET_SCHEMA,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=DICTIONARY_COLUMNS,
+            write_statistics=['time'],
+            data_page_size=1 << 20,
+        )
         
+        # One pool for the whole part: starting workers once instead of per batch of
+        # files. Files are still submitted in batches to bound the results in flight,
+        # and each worker receives several files per IPC round-trip.
         files_per_batch = MAX_WORKERS * 100
-        for offset in range(0, len(trace_files), files_per_batch):
-            batch_files = trace_files[offset:offset + files_per_batch]
-            
-            with concurrent.futures.ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                for rows in executor.map(safe_process, batch_files):
-                    if rows:
-                        batch_rows.extend(rows)
+        chunksize = max(1, files_per_batch // (MAX_WORKERS * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for offset in range(0, len(trace_files), files_per_batch):
+                batch_files = trace_files[offset:offset + files_per_batch]
+                
+                for buf in executor.map(safe_process, batch_files, chunksize=chunksize):
+                    if buf:
+                        batch = pa.ipc.read_record_batch(buf, PARQUET_SCHEMA)
+                        pending_batches.append(batch)
+                        pending_rows += batch.num_rows
                         
-                        if len(batch_rows) >= BATCH_SIZE:
-                            writer.write_table(rows_to_table(batch_rows))
-                            total_rows += len(batch_rows)
-                            batch_rows = []
+                        if pending_rows >= BATCH_SIZE:
+                            writer.write_table(pa.Table.from_batches(pending_batches, schema=PARQUET_SCHEMA))
+                            total_rows += pending_rows
+                            pending_batches = []
+                            pending_rows = 0
                             gc.collect()
-            gc.collect()
+                gc.collect()
         
-        if batch_rows:
-            writer.write_table(rows_to_table(batch_rows))
-            total_rows += len(batch_rows)
+        if pending_batches:
+            writer.write_table(pa.Table.from_batches(pending_batches, schema=PARQUET_SCHEMA))
+            total_rows += pending_rows
     
     finally:
         if writer:
@@ -146,18 +225,17 @@ def main():
     from src.adsb.compress_adsb_to_aircraft_data import compress_parquet_part
     df_compressed = compress_parquet_part(args.part_id, args.date)
     
-    # Write parquet
+    # Write parquet. The reduce step (concat_parquet_to_final) only reads the parquet
+    # files, so no per-part CSV is written. The file is renamed into place once
+    # complete, because main skips parts whose compressed output already exists.
     df_compressed_output = OUTPUT_DIR / "compressed" / args.date/ f"part_{args.part_id}_{args.date}.parquet"
     os.makedirs(df_compressed_output.parent, exist_ok=True)
-    df_compressed.write_parquet(df_compressed_output, compression='snappy')
-    
-    # Write CSV
-    csv_output = OUTPUT_DIR / "compressed" / args.date / f"part_{args.part_id}_{args.date}.csv"
-    df_compressed.write_csv(csv_output)
+    tmp_output = df_compressed_output.with_name(df_compressed_output.name + ".part")
+    df_compressed.write_parquet(tmp_output, compression='zstd', compression_level=3)
+    tmp_output.replace(df_compressed_output)
     
     print(f"Raw output: {output_path}" if output_path else "No raw output generated")
     print(f"Compressed parquet: {df_compressed_output}")
-    print(f"Compressed CSV: {csv_output}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 import argparse
+import shutil
+
+import polars as pl
 
 parser = argparse.ArgumentParser(description="Create daily FAA release")
 parser.add_argument("--date", type=str, help="Date to process (YYYY-MM-DD format, default: today)")
@@ -27,9 +30,12 @@ if not zip_path.exists():
         method="GET",
     )
 
-    with urlopen(req, timeout=120) as r:
-        body = r.read()
-        zip_path.write_bytes(body)
+    # Stream to a temporary file and rename it once complete, so the archive is never
+    # held in memory and an interrupted download is not mistaken for a finished one.
+    tmp_path = zip_path.with_name(zip_path.name + ".part")
+    with urlopen(req, timeout=120) as r, open(tmp_path, "wb") as f:
+        shutil.copyfileobj(r, f, 1024 * 1024)
+    tmp_path.replace(zip_path)
 
 OUT_ROOT = Path("data/openairframes")
 OUT_ROOT.mkdir(parents=True, exist_ok=True)
@@ -46,4 +52,11 @@ except Exception as e:
     df_base = df_new
     start_date_str = date_str
 
-df_base.to_csv(OUT_ROOT / f"openairframes_faa_{start_date_str}_{date_str}.csv", index=False)
\ No newline at end of file
+# Write with Polars' native CSV writer rather than pandas.to_csv. Every value is
+# written as its string form, as pandas would, and empty strings go out as nulls so
+# they stay unquoted empty fields.
+(
+    pl.from_pandas(df_base.astype(str))
+    .with_columns(pl.all().replace("", None))
+    .write_csv(OUT_ROOT / f"openairframes_faa_{start_date_str}_{date_str}.csv")
+)
\ No newline at end of file
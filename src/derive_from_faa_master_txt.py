@@ -1,34 +1,133 @@
 from pathlib import Path
+import io
 import zipfile
+import numpy as np
 import pandas as pd
-from faa_aircraft_registry import read
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from faa_aircraft_registry import aircraft as faa_aircraft
+from faa_aircraft_registry import engines as faa_engines
+from faa_aircraft_registry import master as faa_master
+from faa_aircraft_registry.types import RecordDictType, RegistrantDictType
+
+# Nested record columns and the prefix their flattened fields get
+NESTED_PREFIXES = {
+    "registrant": "registrant_",
+    "aircraft": "aircraft_",
+    "engine": "engine_",
+    "certification": "certificate_",
+}
+
+
+def _map_distinct(values, type_) -> list:
+    """Apply a faa_aircraft_registry field type once per distinct value."""
+    mapping = {val: type_(val) for val in set(values)}
+    return [mapping[val] for val in values]
+
+
+def _lookup_fields(codes: list, table: dict, prefix: str) -> dict[str, list]:
+    """Flatten the ACFTREF/ENGINE entry for each code into prefixed columns, NaN when missing."""
+    if not table:
+        return {}
+    fields = list(next(iter(table.values())))
+    return {
+        prefix + field: [table[code][field] if code in table else np.nan for code in codes]
+        for field in fields
+    }
+
+
+def read_master_df(z: zipfile.ZipFile) -> pd.DataFrame:
+    """Read MASTER.txt into a flat DataFrame, one row per unique_regulatory_id.
+
+    Produces the same values as flattening faa_aircraft_registry.read(), but parses
+    the file with Arrow's CSV reader and converts each column by mapping its distinct
+    values through the library's field types, instead of building a nested dict per
+    record. The small ACFTREF/ENGINE lookup tables are still read by the library.
+    """
+    with z.open("ACFTREF.txt", "r") as f:
+        aircraft = faa_aircraft.read(io.TextIOWrapper(f, "utf-8-sig"))
+    with z.open("ENGINE.txt", "r") as f:
+        engines = faa_engines.read(io.TextIOWrapper(f, "utf-8-sig"))
+
+    # Read every field as text; rows carry a trailing comma, so ignore extra columns
+    n_fields = len(faa_master.fieldnames)
+    with z.open("MASTER.txt", "r") as f:
+        table = pa_csv.read_csv(
+            f,
+            read_options=pa_csv.ReadOptions(skip_rows=1, autogenerate_column_names=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={f"f{i}": pa.string() for i in range(n_fields + 1)},
+                strings_can_be_null=False,
+            ),
+        )
+    raw = {
+        name: table.column(i).to_numpy(zero_copy_only=False)
+        for i, name in enumerate(faa_master.fieldnames)
+    }
+
+    # Records are keyed by unique_regulatory_id: a repeated id keeps the position of
+    # its first row and the values of its last one
+    ids = pd.Series(_map_distinct(raw["unique_regulatory_id"], RecordDictType.__annotations__["unique_regulatory_id"]))
+    if ids.duplicated().any():
+        last = ~ids.duplicated(keep="last")
+        first_seen = ids.groupby(ids, sort=False).ngroup()[last]
+        rows = first_seen.index.to_numpy()[np.argsort(first_seen.to_numpy(), kind="stable")]
+        raw = {name: values[rows] for name, values in raw.items()}
+
+    record_types = RecordDictType.__annotations__
+    renames = {"aircraft_type": "aircraft_type_2", "engine_type": "engine_type_2"}
+    columns: dict[str, list] = {}
+    for name in faa_master.fieldnames:
+        if name in record_types and name not in (
+            "aircraft_manufacturer_code", "engine_manufacturer_code", "certification"
+        ):
+            columns[renames.get(name, name)] = _map_distinct(raw[name], record_types[name])
+
+    other_names = zip(*(raw[name] for name in faa_master.fieldnames if "OTHER NAMES" in name))
+    columns["other_names"] = [[v.strip() for v in names if v.strip()] or None for names in other_names]
+    columns["source"] = ["FAA"] * len(raw["unique_regulatory_id"])
+
+    registrant_types = RegistrantDictType.__annotations__
+    for field, type_ in registrant_types.items():
+        columns[NESTED_PREFIXES["registrant"] + field] = _map_distinct(raw[f"REGISTRANT_{field}"], type_)
+
+    strip = record_types["aircraft_manufacturer_code"]
+    columns.update(_lookup_fields(_map_distinct(raw["aircraft_manufacturer_code"], strip), aircraft, NESTED_PREFIXES["aircraft"]))
+    columns.update(_lookup_fields(_map_distinct(raw["engine_manufacturer_code"], strip), engines, NESTED_PREFIXES["engine"]))
+
+    # Certification parses to a dict (or None); its keys become columns when any row has one
+    certifications = _map_distinct(raw["certification"], record_types["certification"])
+    first = next((cert for cert in certifications if cert), None)
+    for field in first or ():
+        columns[NESTED_PREFIXES["certification"] + field] = [
+            cert[field] if cert else np.nan for cert in certifications
+        ]
+
+    return pd.DataFrame(columns)
+
+
+def _reorder(df: pd.DataFrame, moves: list[tuple[str, int | str]]) -> pd.DataFrame:
+    """Move columns to new positions, selecting the final column order once.
+
+    Each move is (column, position), applied in order; position is either an index
+    or "after:<column>".
+    """
+    order = df.columns.tolist()
+    for col, pos in moves:
+        order.remove(col)
+        if isinstance(pos, str) and pos.startswith("after:"):
+            pos = order.index(pos.removeprefix("after:")) + 1
+        order.insert(pos, col)
+    return df.reindex(columns=order)
+
 
 def convert_faa_master_txt_to_df(zip_path: Path, date: str):
     with zipfile.ZipFile(zip_path) as z:
-        registrations = read(z)
-
-    df = pd.DataFrame(registrations['master'].values())
+        df = read_master_df(z)
     
     df.insert(0, "download_date", date)
     
-    registrant = pd.json_normalize(df["registrant"]).add_prefix("registrant_")
-    df = df.drop(columns="registrant").join(registrant)
-    
-    # Move transponder_code_hex to second column (after registration_number)
-    cols = df.columns.tolist()
-    cols.remove("transponder_code_hex")
-    cols.insert(1, "transponder_code_hex")
-    df = df[cols]
-    
-    df = df.rename(columns={"aircraft_type": "aircraft_type_2"})
-    aircraft = pd.json_normalize(df["aircraft"].where(df["aircraft"].notna(), {})).add_prefix("aircraft_")
-    df = df.drop(columns="aircraft").join(aircraft)
-    df = df.rename(columns={"engine_type": "engine_type_2"})
-    engine = pd.json_normalize(df["engine"].where(df["engine"].notna(), {})).add_prefix("engine_")
-    df = df.drop(columns="engine").join(engine)
-    certification = pd.json_normalize(df["certification"].where(df["certification"].notna(), {})).add_prefix("certificate_")
-    df = df.drop(columns="certification").join(certification)
-    
     # Create openairframes_id
     df["openairframes_id"] = (
         normalize(df["aircraft_manufacturer"])
@@ -38,12 +137,11 @@ def convert_faa_master_txt_to_df(zip_path: Path, date: str):
         + normalize(df["serial_number"])
     )
     
-    # Move openairframes_id to come after registration_number
-    cols = df.columns.tolist()
-    cols.remove("openairframes_id")
-    reg_idx = cols.index("registration_number")
-    cols.insert(reg_idx + 1, "openairframes_id")
-    df = df[cols]
+    # Move transponder_code_hex to second column, then openairframes_id after registration_number
+    df = _reorder(df, [
+        ("transponder_code_hex", 1),
+        ("openairframes_id", "after:registration_number"),
+    ])
     
     # Convert all NaN to empty strings
     df = df.fillna("")
@@ -56,16 +154,12 @@ def convert_faa_master_txt_to_df(zip_path: Path, date: str):
 
 
 def normalize(s: pd.Series) -> pd.Series:
-    return (
-        s.fillna("")
-         .astype(str)
-         .str.upper()
-         .str.strip()
-         # collapse whitespace
-         .str.replace(r"\s+", " ", regex=True)
-         # remove characters that cause false mismatches
-         .str.replace(r"[^\w\-]", "", regex=True)
-    )
+    # Upper-case, then remove characters that cause false mismatches. Whitespace is
+    # not a word character, so this also covers stripping and collapsing it. Runs as
+    # two Arrow kernels over the column instead of a chain of pandas .str passes.
+    arr = pa.array(s.fillna("").astype(str), type=pa.string())
+    arr = pc.replace_substring_regex(pc.utf8_upper(arr), r"[^\w\-]", "")
+    return arr.to_pandas().set_axis(s.index)
 
 
 def concat_faa_historical_df(df_base, df_new):
@@ -115,16 +209,13 @@ def concat_faa_historical_df(df_base, df_new):
                 # Not a number, return as-is
                 return val_str
         
-        return series.apply(normalize_value)
-    
-    df_base["row_fingerprint"] = (
-        df_base[CONTENT_COLS]
-        .apply(normalize_series, axis=0)
-        .apply(lambda row: "|".join(row), axis=1)
-    )
+        # normalize_value gives the same result for a value and its string form, so
+        # normalize each distinct string once and map it back onto the column.
+        as_str = series.astype(str).fillna("")
+        mapping = {val: normalize_value(val) for val in as_str.unique()}
+        return as_str.map(mapping)
     
-    df_base = df_base.drop_duplicates(
-              subset=["row_fingerprint"],
-              keep="first"
-          ).drop(columns=["row_fingerprint"])
+    # Compare rows on their normalized values column by column; no per-row fingerprint
+    normalized = df_base[CONTENT_COLS].apply(normalize_series, axis=0)
+    df_base = df_base[~normalized.duplicated(keep="first")]
     return df_base
\ No newline at end of file
@@ -150,11 +150,24 @@ def download_latest_aircraft_csv(
 
 def get_latest_aircraft_faa_csv_df():
     csv_path = download_latest_aircraft_csv()
-    import pandas as pd
-    df = pd.read_csv(csv_path, dtype={'transponder_code': str, 
-           'unique_regulatory_id': str, 
-           'registrant_county': str})
-    df = df.fillna("")
+    import csv
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    # Read every column as text with empty fields kept as "", so values round-trip
+    # unchanged and no per-column type inference or NaN fill pass is needed. Arrow's
+    # reader parses straight into the Arrow strings that back pandas' str columns,
+    # so the frame is built without going through Python objects.
+    with open(csv_path, newline="") as f:
+        header = next(csv.reader(f))
+    table = pa_csv.read_csv(
+        csv_path,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+        ),
+    )
+    df = table.to_pandas()
     # Extract start date from filename pattern: openairframes_faa_{start_date}_{end_date}.csv
     match = re.search(r"openairframes_faa_(\d{4}-\d{2}-\d{2})_", str(csv_path))
     if not match:
@@ -215,7 +228,9 @@ def get_latest_aircraft_adsb_csv_df():
     import re
     
     csv_path = download_latest_aircraft_adsb_csv()
-    df = pl.read_csv(csv_path, null_values=[""])
+    # Read every column as text: the compress functions treat them as strings anyway,
+    # and it avoids inferring e.g. an all-digit icao or registration as an integer.
+    df = pl.read_csv(csv_path, null_values=[""], infer_schema=False)
     
     # Parse time column: values like "2025-12-31T00:00:00.040" or "2025-05-11T15:15:50.540+0000"
     # Try with timezone first (convert to naive), then without timezone
@@ -225,15 +240,8 @@ def get_latest_aircraft_adsb_csv_df():
             .fill_null(pl.col("time").str.strptime(pl.Datetime("ms"), "%Y-%m-%dT%H:%M:%S%.f", strict=False))
     )
 
-    # Cast dbFlags and year to strings to match the schema used in compress functions
-    for col in ['dbFlags', 'year']:
-        if col in df.columns:
-            df = df.with_columns(pl.col(col).cast(pl.Utf8))
-    
     # Fill nulls with empty strings for string columns
-    for col in df.columns:
-        if df[col].dtype == pl.Utf8:
-            df = df.with_columns(pl.col(col).fill_null(""))
+    df = df.with_columns(pl.col(pl.Utf8).fill_null(""))
     
     # Extract start and end dates from filename pattern: openairframes_adsb_{start_date}_{end_date}.csv[.gz]
     match = re.search(r"openairframes_adsb_(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})\.csv", str(csv_path))